@@ -2,9 +2,10 @@
 
 Requires a Honeywell HGI80 (or compatible) gateway.
 """
+import asyncio
 from datetime import timedelta
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import serial
 import voluptuous as vol
@@ -35,56 +36,88 @@ from .const import (
 )
 
 _LOGGER = logging.getLogger(__name__)
-_LOGGER.setLevel(logging.DEBUG)  # TODO: remove for production
 
 SCAN_INTERVAL_DEFAULT = timedelta(seconds=300)
 SCAN_INTERVAL_MINIMUM = timedelta(seconds=10)
 
-CONFIG_SCHEMA = vol.Schema(
+DOMAIN_SCHEMA = vol.Schema(
     {
-        DOMAIN: vol.Schema(
-            {
-                vol.Required("serial_port"): cv.string,
-                vol.Required("packet_log"): cv.string,
-                vol.Optional(
-                    CONF_SCAN_INTERVAL, default=SCAN_INTERVAL_DEFAULT
-                ): vol.All(cv.time_period, vol.Range(min=SCAN_INTERVAL_MINIMUM)),
-                vol.Optional("schema"): dict,
-                # vol.Optional("allow_list"): list,
-                vol.Optional("ignore_list"): list,
-                vol.Optional("max_zones", default=12): vol.Any(None, int),
-            },
-            # extra=vol.ALLOW_EXTRA,  # TODO: remove for production
-        )
+        vol.Required("serial_port"): cv.string,
+        vol.Required("packet_log"): cv.string,
+        vol.Optional(CONF_SCAN_INTERVAL, default=SCAN_INTERVAL_DEFAULT): vol.All(
+            cv.time_period, vol.Range(min=SCAN_INTERVAL_MINIMUM)
+        ),
+        vol.Optional("schema"): dict,
+        # vol.Optional("allow_list"): list,
+        vol.Optional("ignore_list"): list,
+        vol.Optional("max_zones", default=12): vol.Any(None, int),
     },
-    extra=vol.ALLOW_EXTRA,
+    # extra=vol.ALLOW_EXTRA,  # TODO: remove for production
 )
 
+CONFIG_SCHEMA = vol.Schema({DOMAIN: DOMAIN_SCHEMA}, extra=vol.ALLOW_EXTRA)
+
+
+# attribute presence is a property of the device class, so probe once per class
+_BSENSOR_SET = frozenset(BINARY_SENSOR_ATTRS)
+_SENSOR_SET = frozenset(SENSOR_ATTRS)
+_CLASS_HAS_BSENSOR: Dict[type, bool] = {}
+_CLASS_HAS_SENSOR: Dict[type, bool] = {}
+
+
+def _has_any_attr(device, attrs: frozenset, cache: Dict[type, bool]) -> bool:
+    """Return True if the device's class defines any of the attrs.
+
+    Only the class is probed (and properties are not invoked), so this
+    classification is static; the platforms still use hasattr() to decide which
+    entities to create for each device.
+    """
+    flag = cache.get(type(device))
+    if flag is None:
+        flag = cache[type(device)] = not attrs.isdisjoint(dir(type(device)))
+    return flag
+
+
+def _is_new_binary_sensor(broker, device) -> bool:
+    return id(device) not in broker._binary_sensor_ids and _has_any_attr(
+        device, _BSENSOR_SET, _CLASS_HAS_BSENSOR
+    )
+
+
+def _is_new_sensor(broker, device) -> bool:
+    return id(device) not in broker._sensor_ids and _has_any_attr(
+        device, _SENSOR_SET, _CLASS_HAS_SENSOR
+    )
+
+
+def classify_new_devices(broker) -> Tuple[list, list]:
+    """Return the new binary sensor and sensor devices, in a single pass.
+
+    Used by update(), which needs both; the platforms use the single-purpose
+    new_binary_sensors() / new_sensors() instead.
+    """
+    binary_sensor_devs, sensor_devs = [], []
+
+    for d in broker.client.evo.devices:
+        if _is_new_binary_sensor(broker, d):
+            binary_sensor_devs.append(d)
+        if _is_new_sensor(broker, d):
+            sensor_devs.append(d)
+
+    return binary_sensor_devs, sensor_devs
+
 
 def new_binary_sensors(broker) -> list:
-    return [
-        d
-        for d in broker.client.evo.devices
-        if d not in broker.binary_sensors
-        and any([hasattr(d, a) for a in BINARY_SENSOR_ATTRS])
-    ]
+    return [d for d in broker.client.evo.devices if _is_new_binary_sensor(broker, d)]
 
 
 def new_sensors(broker) -> list:
-    return [
-        d
-        for d in broker.client.evo.devices
-        if d not in broker.sensors and any([hasattr(d, a) for a in SENSOR_ATTRS])
-    ]
+    return [d for d in broker.client.evo.devices if _is_new_sensor(broker, d)]
 
 
 async def async_setup(hass: HomeAssistantType, hass_config: ConfigType) -> bool:
     """xxx."""
 
-    async def load_system_config(store) -> Optional[Dict]:
-        app_storage = await store.async_load()
-        return dict(app_storage if app_storage else {})
-
     if __version__ == evohome_rf.__version__:
         _LOGGER.warning(
             "evohome_cc v%s, using evohome_rf v%s - versions match (this is good)",
@@ -99,7 +132,8 @@ async def async_setup(hass: HomeAssistantType, hass_config: ConfigType) -> bool:
         )
 
     store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
-    evohome_store = await load_system_config(store)
+    app_storage = await store.async_load()
+    evohome_store = dict(app_storage) if app_storage else {}
 
     _LOGGER.debug("Store = %s, Config =  %s", evohome_store, hass_config[DOMAIN])
 
@@ -110,20 +144,23 @@ async def async_setup(hass: HomeAssistantType, hass_config: ConfigType) -> bool:
     # ptvsd.wait_for_attach()
     # _LOGGER.debug("Debugger is attached!")
 
-    kwargs = dict(hass_config[DOMAIN])
-    serial_port = kwargs.pop("serial_port")
-    kwargs["blocklist"] = dict.fromkeys(kwargs.pop("ignore_list", []), {})
+    config = hass_config[DOMAIN]
+    kwargs = {
+        "packet_log": config["packet_log"],
+        "max_zones": config["max_zones"],
+        "blocklist": {k: {} for k in config.get("ignore_list", ())},
+    }
+    if "schema" in config:
+        kwargs["schema"] = config["schema"]
 
     try:  # TODO: test invalid serial_port="AA"
-        client = evohome_rf.Gateway(serial_port, loop=hass.loop, **kwargs)
+        client = evohome_rf.Gateway(config["serial_port"], loop=hass.loop, **kwargs)
     except serial.SerialException as exc:
         _LOGGER.exception("Unable to open serial port. Message is: %s", exc)
         return False
 
     hass.data[DOMAIN] = {}
-    hass.data[DOMAIN]["broker"] = broker = EvoBroker(
-        hass, client, store, hass_config[DOMAIN]
-    )
+    hass.data[DOMAIN]["broker"] = broker = EvoBroker(hass, client, store, config)
 
     broker.hass_config = hass_config
 
@@ -131,7 +168,7 @@ async def async_setup(hass: HomeAssistantType, hass_config: ConfigType) -> bool:
     broker.loop_task = hass.loop.create_task(client.start())
 
     hass.helpers.event.async_track_time_interval(
-        broker.update, hass_config[DOMAIN][CONF_SCAN_INTERVAL]
+        broker.update, config[CONF_SCAN_INTERVAL]
     )
 
     return True
@@ -140,6 +177,24 @@ async def async_setup(hass: HomeAssistantType, hass_config: ConfigType) -> bool:
 class EvoBroker:
     """Container for client and data."""
 
+    __slots__ = (
+        "hass",
+        "client",
+        "_store",
+        "params",
+        "config",
+        "status",
+        "binary_sensors",
+        "climates",
+        "water_heater",
+        "sensors",
+        "_binary_sensor_ids",
+        "_sensor_ids",
+        "hass_config",
+        "loop_task",
+        "_last_generation",
+    )
+
     def __init__(self, hass, client, store, params) -> None:
         """Initialize the client and its data structure(s)."""
         self.hass = hass
@@ -154,17 +209,41 @@ class EvoBroker:
         self.climates = []
         self.water_heater = None
         self.sensors = []
+        self._binary_sensor_ids = set()  # for O(1) membership tests
+        self._sensor_ids = set()
 
         self.hass_config = None
         self.loop_task = None
 
+        self._last_generation = None
+
+    def add_binary_sensors(self, devices: list) -> None:
+        """Record the devices as having binary sensor entities."""
+        self.binary_sensors += devices
+        self._binary_sensor_ids.update(id(d) for d in devices)
+
+    def add_sensors(self, devices: list) -> None:
+        """Record the devices as having sensor entities."""
+        self.sensors += devices
+        self._sensor_ids.update(id(d) for d in devices)
+
     async def save_system_config(self) -> None:
         """Save..."""
         app_storage = {}
 
         await self._store.async_save(app_storage)
 
-    async def update(self, *args, **kwargs) -> None:
+    async def _load_platforms(self, platforms: list) -> None:
+        """Load the (newly discovered) platforms concurrently, as a single task."""
+        await asyncio.gather(
+            *[
+                async_load_platform(self.hass, p, DOMAIN, {}, self.hass_config)
+                for p in platforms
+            ]
+        )
+
+    @callback
+    def update(self, *args, **kwargs) -> None:
         """Retrieve the latest state data..."""
 
         #     self.hass.async_create_task(self._update(self.hass, *args, **kwargs))
@@ -173,36 +252,44 @@ class EvoBroker:
         #     """Retrieve the latest state data..."""
 
         evohome = self.client.evo
-        _LOGGER.debug("Schema = %s", evohome.schema if evohome is not None else None)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Schema = %s", evohome.schema if evohome is not None else None
+            )
         if evohome is None:
             return
 
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Params = %s", evohome.params)
+            _LOGGER.debug("Status = %s", evohome.status)
+
+        # nothing new can have been discovered unless the system has grown
+        generation = (len(evohome.devices), len(evohome.zones), bool(evohome.dhw))
+        if generation == self._last_generation:
+            self.hass.helpers.dispatcher.async_dispatcher_send(DOMAIN)
+            return
+
+        pending = []
+
         if [z for z in evohome.zones if z not in self.climates]:
-            self.hass.async_create_task(
-                async_load_platform(self.hass, "climate", DOMAIN, {}, self.hass_config)
-            )
+            pending.append("climate")
 
         if evohome.dhw and self.water_heater is None:
-            self.hass.async_create_task(
-                async_load_platform(
-                    self.hass, "water_heater", DOMAIN, {}, self.hass_config
-                )
-            )
+            pending.append("water_heater")
 
-        if new_sensors(self):
-            self.hass.async_create_task(
-                async_load_platform(self.hass, "sensor", DOMAIN, {}, self.hass_config)
-            )
+        binary_sensor_devs, sensor_devs = classify_new_devices(self)
 
-        if new_binary_sensors(self):
-            self.hass.async_create_task(
-                async_load_platform(
-                    self.hass, "binary_sensor", DOMAIN, {}, self.hass_config
-                )
-            )
+        if sensor_devs:
+            pending.append("sensor")
+
+        if binary_sensor_devs:
+            pending.append("binary_sensor")
 
-        _LOGGER.debug("Params = %s", evohome.params)
-        _LOGGER.debug("Status = %s", evohome.status)
+        # only skip the checks once everything found is represented by an entity
+        if pending:
+            self.hass.async_create_task(self._load_platforms(pending))
+        else:
+            self._last_generation = generation
 
         # inform the evohome devices that state data has been updated
         self.hass.helpers.dispatcher.async_dispatcher_send(DOMAIN)
@@ -211,6 +298,17 @@ class EvoBroker:
 class EvoEntity(Entity):
     """Base for any evohome II-compatible entity (e.g. Climate, Sensor)."""
 
+    __slots__ = (
+        "_evo_device",
+        "_evo_broker",
+        "_unique_id",
+        "_name",
+        "_device_state_attrs",
+        "_controller_id",
+    )
+
+    should_poll = False  # entities are updated via the dispatcher
+
     def __init__(self, evo_broker, evo_device) -> None:
         """Initialize the entity."""
         self._evo_device = evo_device
@@ -218,16 +316,12 @@ class EvoEntity(Entity):
 
         self._unique_id = self._name = None
         self._device_state_attrs = {}
+        self._controller_id = None  # cached once bound, as it won't change
 
     @callback
     def _refresh(self) -> None:
         self.async_schedule_update_ha_state(force_refresh=True)
 
-    @property
-    def should_poll(self) -> bool:
-        """Entities should not be polled."""
-        return False
-
     @property
     def unique_id(self) -> Optional[str]:
         """Return a unique ID."""
@@ -245,9 +339,9 @@ class EvoEntity(Entity):
         # for attr in ("schema", "config", "status"):
         #     if hasattr(self._evo_device, attr):
         #         result.update({attr: getattr(self._evo_device, attr)})
-        return {
-            "controller": self._evo_device._ctl.id if self._evo_device._ctl else None,
-        }
+        if self._controller_id is None and self._evo_device._ctl:
+            self._controller_id = self._evo_device._ctl.id
+        return {"controller": self._controller_id}
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -257,6 +351,8 @@ class EvoEntity(Entity):
 class EvoDeviceBase(EvoEntity):
     """Base for any evohome II-compatible entity (e.g. Climate, Sensor)."""
 
+    __slots__ = ("_device_class",)
+
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
@@ -270,16 +366,21 @@ class EvoDeviceBase(EvoEntity):
     @property
     def device_state_attributes(self) -> Dict[str, Any]:
         """Return the integration-specific state attributes."""
+        zone = self._evo_device.zone  # not cached: may be (re)bound at any time
         return {
             **super().device_state_attributes,
             "domain_id": self._evo_device._domain_id,
-            "zone_name": self._evo_device.zone.name if self._evo_device.zone else None,
+            "zone_name": zone.name if zone else None,
         }
 
 
 class EvoZoneBase(EvoEntity):
     """Base for any evohome RF-compatible entity (e.g. Climate, Sensor)."""
 
+    __slots__ = ("_supported_features",)
+
+    temperature_unit = TEMP_CELSIUS
+
     @property
     def current_temperature(self) -> Optional[float]:
         """Return the current temperature."""
@@ -293,8 +394,3 @@ class EvoZoneBase(EvoEntity):
     def supported_features(self) -> int:
         """Return the list of supported features."""
         return self._supported_features
-
-    @property
-    def temperature_unit(self) -> str:
-        """Return the unit of measurement used by the platform."""
-        return TEMP_CELSIUS
@@ -54,7 +54,7 @@ async def async_setup_platform(
         new_entities.append(EvoWindow(broker, device, DEVICE_CLASS_WINDOW))
 
     if new_entities:
-        broker.binary_sensors += new_devices
+        broker.add_binary_sensors(new_devices)
         async_add_entities(new_entities, update_before_add=True)
 
 
@@ -60,7 +60,7 @@ async def async_setup_platform(
         new_entities.append(EvoFaultLog(broker, device, "fault_log"))
 
     if new_entities:
-        broker.sensors += new_devices
+        broker.add_sensors(new_devices)
         async_add_entities(new_entities, update_before_add=True)
 
 